@@ -1,40 +1,49 @@
-from dataclasses import dataclass
-from enum import Enum
-from typing import Optional, List, Dict
-import random
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from enum import IntEnum
+from types import MappingProxyType
+from typing import ClassVar, Optional, List, Dict, Iterator, Deque, Mapping, NamedTuple, Tuple
 import math
-import time
-
-class AlertLevel(Enum):
-    STANDARD = "standard"
-    HEIGHTENED = "heightened"
-    CRITICAL = "critical"
-    COMBAT = "combat"
-
-class MissionType(Enum):
-    RECON = "recon"
-    DIRECT_ACTION = "direct_action"
-    AMBUSH = "ambush"
-    WITHDRAWAL = "withdrawal"
-    HOLDING = "holding"
-
-class ThreatType(Enum):
-    AMBUSH = "ambush"
-    SNIPER = "sniper"
-    IED = "ied"
-    DIRECT_FIRE = "direct_fire"
-    INDIRECT_FIRE = "indirect_fire"
-    PURSUIT = "pursuit"
-
-class SoldierStatus(Enum):
-    NORMAL = "normal"
-    WOUNDED = "wounded"
-    EXHAUSTED = "exhausted"
-    PANICKED = "panicked"
-    FOCUSED = "focused"
-    TUNNEL_VISION = "tunnel_vision"
-
-@dataclass
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+class AlertLevel(IntEnum):
+    STANDARD = 0
+    HEIGHTENED = 1
+    CRITICAL = 2
+    COMBAT = 3
+
+class MissionType(IntEnum):
+    RECON = 0
+    DIRECT_ACTION = 1
+    AMBUSH = 2
+    WITHDRAWAL = 3
+    HOLDING = 4
+
+class ThreatType(IntEnum):
+    AMBUSH = 0
+    SNIPER = 1
+    IED = 2
+    DIRECT_FIRE = 3
+    INDIRECT_FIRE = 4
+    PURSUIT = 5
+
+class SoldierStatus(IntEnum):
+    NORMAL = 0
+    WOUNDED = 1
+    EXHAUSTED = 2
+    PANICKED = 3
+    FOCUSED = 4
+    TUNNEL_VISION = 5
+
+_ALERT_VALUES = tuple(level.name.lower() for level in AlertLevel)
+_MISSION_VALUES = tuple(mission.name.lower() for mission in MissionType)
+_THREAT_VALUES = tuple(threat.name.lower() for threat in ThreatType)
+_STATUS_VALUES = tuple(status.name.lower() for status in SoldierStatus)
+
+@dataclass(slots=True)
 class PhysiologicalMetrics:
     heart_rate_bpm: float
     respiratory_rate: float
@@ -45,89 +54,335 @@ class PhysiologicalMetrics:
     reaction_time_ms: float
     situational_awareness: float
 
+class AcuteResponse(NamedTuple):
+    concentration: float
+    sympathetic_activation: float
+    pain_threshold: float
+    auditory_gating: bool
+    peripheral_vision_loss: bool
+    reaction_time_improvement: bool
+    metrics: PhysiologicalMetrics
+
+    def to_dict(self) -> Dict:
+        return self._asdict()
+
+VITALS_DTYPE = np.dtype([(field.name, np.float64) for field in fields(PhysiologicalMetrics)])
+
+def compute_metrics_batch(concentration: np.ndarray) -> np.ndarray:
+    out = np.empty(len(concentration), dtype=VITALS_DTYPE)
+    out["heart_rate_bpm"] = 110 + concentration * 8
+    out["respiratory_rate"] = 22 + concentration * 2.5
+    out["pupil_dilation"] = np.minimum(0.95, 0.3 + concentration * 0.08)
+    out["tremor_intensity"] = concentration * 0.12
+    out["auditory_threshold"] = np.minimum(0.85, 0.2 + concentration * 0.09)
+    out["visual_field"] = np.minimum(0.75, 0.15 + concentration * 0.1)
+    out["reaction_time_ms"] = np.maximum(160, 320 - concentration * 18)
+    out["situational_awareness"] = np.maximum(0.25, 0.95 - concentration * 0.12)
+    return out
+
+def performance_modifier_batch(peak_response: np.ndarray, peak_timestamp: np.ndarray, now: float, concentration: np.ndarray) -> np.ndarray:
+    elapsed = now - peak_timestamp
+    return np.where(
+        peak_response,
+        np.where(elapsed > 180, np.maximum(0.4, 1.0 - (elapsed - 180) * 0.008), 1.0 + concentration * 0.08),
+        1.0
+    )
+
+_COG_KEYS = ("working_memory", "processing_speed", "immune_competence", "tissue_repair", "muscle_recovery_rate")
+_COG_FLOORS = np.array([0.45, 0.55, 0.35, 0.25, 0.4], dtype=np.float64)
+_COG_SLOPES = np.array([0.025, 0.018, 0.035, 0.04, 0.025], dtype=np.float64)
+
+def cognitive_metrics_batch(elevation: float | np.ndarray) -> np.ndarray:
+    return np.maximum(_COG_FLOORS, 1.0 - np.multiply.outer(elevation, _COG_SLOPES))
+
+_STATUS_BY_ID = tuple(SoldierStatus)
+_ALERT_BY_ID = tuple(AlertLevel)
+_MISSION_BY_ID = tuple(MissionType)
+_NO_MISSION = -1
+_DEFAULT_MISSION = MissionType.DIRECT_ACTION
+
+THREAT_LIST = tuple(ThreatType)
+THREAT_MULT = np.array([7.5, 6.8, 8.2, 5.9, 4.7, 3.9], dtype=np.float64)
+MISSION_FACTOR = np.array([1.15, 1.65, 1.9, 1.55, 1.35], dtype=np.float64)
+
+ENGAGEMENT_HOURS = 0.5
+ENGAGEMENT_CORT_LOAD = ENGAGEMENT_HOURS * MISSION_FACTOR * 1.8
+
+_RETAIN_STATE = 255
+THREAT_TO_STATE = np.array([
+    SoldierStatus.FOCUSED,
+    SoldierStatus.FOCUSED,
+    SoldierStatus.TUNNEL_VISION,
+    _RETAIN_STATE,
+    _RETAIN_STATE,
+    _RETAIN_STATE
+], dtype=np.uint8)
+
+ADR_HALF_LIFE_SECONDS = 120
+CORT_HALF_LIFE_HOURS = 1.5
+ADR_DECAY_1S = math.log(0.5) / ADR_HALF_LIFE_SECONDS
+CORT_DECAY_1H = math.log(0.5) / CORT_HALF_LIFE_HOURS
+DECAY_4H = math.exp(CORT_DECAY_1H * 4)
+RECOVERY_PERIOD_HOURS = 72
+ADR_DECAY_RECOVERY = math.exp(ADR_DECAY_1S * RECOVERY_PERIOD_HOURS * 3600)
+CORT_DECAY_RECOVERY = math.exp(CORT_DECAY_1H * RECOVERY_PERIOD_HOURS)
+
+CIRC_MULT = np.ones(24, dtype=np.float64)
+CIRC_MULT[5:10] = 1.35
+CIRC_MULT[:5] = 0.75
+CIRC_MULT[23:] = 0.75
+CIRC_MULT_CHRONIC = CIRC_MULT.copy()
+CIRC_MULT_CHRONIC[:5] = 1.15
+CIRC_MULT_CHRONIC[23:] = 1.15
+
+EVENT_LOG_CAPACITY = 256
+
+_rng = np.random.default_rng()
+
+def seed(value: Optional[int] = None) -> None:
+    global _rng
+    _rng = np.random.default_rng(value)
+
+class PhysiologyBuffer:
+    _COLUMNS: ClassVar[Tuple[Tuple[str, DTypeLike], ...]] = (
+        ("adr", np.float64),
+        ("adr_trigger", np.float64),
+        ("cort", np.float64),
+        ("peak_ts", np.float64),
+        ("peak_resp", np.bool_),
+        ("state_id", np.uint8),
+        ("posture_id", np.uint8),
+        ("mission_id", np.int8),
+        ("cort_baseline", np.float64),
+        ("deploy_days", np.float64),
+        ("chronic", np.bool_),
+        ("rounds", np.int64),
+        ("recovery_deficit", np.float64),
+        ("encounters", np.int64),
+        ("casualties", np.int64),
+    )
+    __slots__ = ("size", "capacity", "sim_time", "log_enabled", "_layout") + tuple(name for name, _ in _COLUMNS)
+
+    size: int
+    capacity: int
+    sim_time: float
+    log_enabled: bool
+    _layout: Tuple[Tuple[str, DTypeLike], ...]
+    adr: np.ndarray
+    adr_trigger: np.ndarray
+    cort: np.ndarray
+    peak_ts: np.ndarray
+    peak_resp: np.ndarray
+    state_id: np.ndarray
+    posture_id: np.ndarray
+    mission_id: np.ndarray
+    cort_baseline: np.ndarray
+    deploy_days: np.ndarray
+    chronic: np.ndarray
+    rounds: np.ndarray
+    recovery_deficit: np.ndarray
+    encounters: np.ndarray
+    casualties: np.ndarray
+
+    def __init__(self, capacity: int = 8, layout: Optional[Tuple[Tuple[str, DTypeLike], ...]] = None):
+        self.size = 0
+        self.capacity = capacity
+        self.sim_time = 0.0
+        self.log_enabled = True
+        self._layout = self._COLUMNS if layout is None else layout
+        for name, dtype in self._layout:
+            setattr(self, name, np.empty(capacity, dtype=dtype))
+
+    def allocate(self) -> int:
+        if self.size == self.capacity:
+            self._grow(max(1, 2 * self.capacity))
+        idx = self.size
+        self.size += 1
+        return idx
+
+    def _grow(self, capacity: int) -> None:
+        for name, dtype in self._layout:
+            column = np.empty(capacity, dtype=dtype)
+            column[:self.size] = getattr(self, name)[:self.size]
+            setattr(self, name, column)
+        self.capacity = capacity
+
+    def extract(self, idx: int) -> "PhysiologyBuffer":
+        row = PhysiologyBuffer(1, self._layout)
+        row.size = 1
+        row.sim_time = self.sim_time
+        for name, _ in self._layout:
+            getattr(row, name)[0] = getattr(self, name)[idx]
+        return row
+
 class Adrenaline:
-    def __init__(self, baseline: float = 1.0):
+    __slots__ = ("_buffer", "idx", "_baseline")
+    _LAYOUT: ClassVar[Tuple[Tuple[str, DTypeLike], ...]] = tuple(
+        column for column in PhysiologyBuffer._COLUMNS if column[0] in ("adr", "adr_trigger", "peak_ts", "peak_resp")
+    )
+
+    def __init__(self, baseline: float = 1.0, buffer: Optional[PhysiologyBuffer] = None, idx: Optional[int] = None):
+        if buffer is None:
+            buffer = PhysiologyBuffer(1, self._LAYOUT)
+        self._buffer = buffer
+        self.idx = buffer.allocate() if idx is None else idx
         self.concentration = baseline
         self.baseline = baseline
-        self.half_life_seconds = 120
         self.peak_response = False
-        self.peak_timestamp = 0
+        self.peak_timestamp = 0.0
+
+    @property
+    def sim_time(self) -> float:
+        return self._buffer.sim_time
+
+    @sim_time.setter
+    def sim_time(self, value: float) -> None:
+        self._buffer.sim_time = value
+
+    @property
+    def concentration(self) -> float:
+        return float(self._buffer.adr[self.idx])
+
+    @concentration.setter
+    def concentration(self, value: float) -> None:
+        self._buffer.adr[self.idx] = value
+
+    @property
+    def baseline(self) -> float:
+        return self._baseline
+
+    @baseline.setter
+    def baseline(self, value: float) -> None:
+        self._baseline = value
+        self._buffer.adr_trigger[self.idx] = value * 1.1
+
+    @property
+    def baseline_trigger(self) -> float:
+        return float(self._buffer.adr_trigger[self.idx])
+
+    @property
+    def peak_response(self) -> bool:
+        return bool(self._buffer.peak_resp[self.idx])
+
+    @peak_response.setter
+    def peak_response(self, value: bool) -> None:
+        self._buffer.peak_resp[self.idx] = value
+
+    @property
+    def peak_timestamp(self) -> float:
+        return float(self._buffer.peak_ts[self.idx])
+
+    @peak_timestamp.setter
+    def peak_timestamp(self, value: float) -> None:
+        self._buffer.peak_ts[self.idx] = value
         
     def metabolize(self, seconds_elapsed: float) -> None:
-        decay_factor = 0.5 ** (seconds_elapsed / self.half_life_seconds)
-        self.concentration *= decay_factor
-        if self.concentration < self.baseline * 1.1:
-            self.peak_response = False
+        concentration = self.concentration * math.exp(ADR_DECAY_1S * seconds_elapsed)
+        self.concentration = concentration
+        self.peak_response = self.peak_response and concentration >= self.baseline_trigger
             
-    def acute_stress_response(self, threat: ThreatType) -> Dict:
-        threat_multipliers = {
-            ThreatType.AMBUSH: 7.5,
-            ThreatType.SNIPER: 6.8,
-            ThreatType.IED: 8.2,
-            ThreatType.DIRECT_FIRE: 5.9,
-            ThreatType.INDIRECT_FIRE: 4.7,
-            ThreatType.PURSUIT: 3.9
-        }
-        
-        self.concentration *= threat_multipliers.get(threat, 3.0)
+    def acute_stress_response(self, threat: ThreatType) -> AcuteResponse:
+        self.concentration *= THREAT_MULT[threat]
         self.peak_response = True
-        self.peak_timestamp = time.time()
-        
-        metrics = PhysiologicalMetrics(
-            heart_rate_bpm=110 + self.concentration * 8,
-            respiratory_rate=22 + self.concentration * 2.5,
-            pupil_dilation=min(0.95, 0.3 + self.concentration * 0.08),
-            tremor_intensity=self.concentration * 0.12,
-            auditory_threshold=min(0.85, 0.2 + self.concentration * 0.09),
-            visual_field=min(0.75, 0.15 + self.concentration * 0.1),
-            reaction_time_ms=max(160, 320 - self.concentration * 18),
-            situational_awareness=max(0.25, 0.95 - self.concentration * 0.12)
-        )
+        self.peak_timestamp = self._buffer.sim_time
+        return self._stress_profile()
+
+    def _stress_profile(self, metrics: Optional[PhysiologicalMetrics] = None) -> AcuteResponse:
+        if metrics is None:
+            metrics = PhysiologicalMetrics(
+                heart_rate_bpm=110 + self.concentration * 8,
+                respiratory_rate=22 + self.concentration * 2.5,
+                pupil_dilation=min(0.95, 0.3 + self.concentration * 0.08),
+                tremor_intensity=self.concentration * 0.12,
+                auditory_threshold=min(0.85, 0.2 + self.concentration * 0.09),
+                visual_field=min(0.75, 0.15 + self.concentration * 0.1),
+                reaction_time_ms=max(160, 320 - self.concentration * 18),
+                situational_awareness=max(0.25, 0.95 - self.concentration * 0.12)
+            )
         
-        return {
-            "concentration": round(self.concentration, 1),
-            "sympathetic_activation": min(1.0, 0.4 + self.concentration * 0.1),
-            "pain_threshold": min(0.95, 0.4 + self.concentration * 0.08),
-            "auditory_gating": metrics.auditory_threshold > 0.45,
-            "peripheral_vision_loss": metrics.visual_field < 0.35,
-            "reaction_time_improvement": metrics.reaction_time_ms < 210,
-            "metrics": metrics
-        }
+        return AcuteResponse(
+            concentration=self.concentration,
+            sympathetic_activation=min(1.0, 0.4 + self.concentration * 0.1),
+            pain_threshold=min(0.95, 0.4 + self.concentration * 0.08),
+            auditory_gating=metrics.auditory_threshold > 0.45,
+            peripheral_vision_loss=metrics.visual_field < 0.35,
+            reaction_time_improvement=metrics.reaction_time_ms < 210,
+            metrics=metrics
+        )
     
-    def performance_modifier(self) -> float:
+    def performance_modifier(self, now: Optional[float] = None) -> float:
         if not self.peak_response:
             return 1.0
-        duration = time.time() - self.peak_timestamp
+        if now is None:
+            now = self._buffer.sim_time
+        duration = now - self.peak_timestamp
         if duration > 180:
             return max(0.4, 1.0 - (duration - 180) * 0.008)
         return 1.0 + self.concentration * 0.08
 
 class Cortisol:
-    def __init__(self, baseline: float = 12.0):
+    __slots__ = ("_buffer", "idx")
+    _LAYOUT: ClassVar[Tuple[Tuple[str, DTypeLike], ...]] = tuple(
+        column for column in PhysiologyBuffer._COLUMNS
+        if column[0] in ("cort", "cort_baseline", "deploy_days", "chronic", "recovery_deficit")
+    )
+
+    def __init__(self, baseline: float = 12.0, buffer: Optional[PhysiologyBuffer] = None, idx: Optional[int] = None):
+        if buffer is None:
+            buffer = PhysiologyBuffer(1, self._LAYOUT)
+        self._buffer = buffer
+        self.idx = buffer.allocate() if idx is None else idx
         self.concentration = baseline
         self.baseline = baseline
-        self.half_life_hours = 1.5
-        self.deployment_days = 0
+        self.deployment_days = 0.0
         self.recovery_deficit = 0.0
         self.chronic_adaptation = False
+
+    @property
+    def concentration(self) -> float:
+        return float(self._buffer.cort[self.idx])
+
+    @concentration.setter
+    def concentration(self, value: float) -> None:
+        self._buffer.cort[self.idx] = value
+
+    @property
+    def baseline(self) -> float:
+        return float(self._buffer.cort_baseline[self.idx])
+
+    @baseline.setter
+    def baseline(self, value: float) -> None:
+        self._buffer.cort_baseline[self.idx] = value
+
+    @property
+    def deployment_days(self) -> float:
+        return float(self._buffer.deploy_days[self.idx])
+
+    @deployment_days.setter
+    def deployment_days(self, value: float) -> None:
+        self._buffer.deploy_days[self.idx] = value
+
+    @property
+    def chronic_adaptation(self) -> bool:
+        return bool(self._buffer.chronic[self.idx])
+
+    @chronic_adaptation.setter
+    def chronic_adaptation(self, value: bool) -> None:
+        self._buffer.chronic[self.idx] = value
+
+    @property
+    def recovery_deficit(self) -> float:
+        return float(self._buffer.recovery_deficit[self.idx])
+
+    @recovery_deficit.setter
+    def recovery_deficit(self, value: float) -> None:
+        self._buffer.recovery_deficit[self.idx] = value
         
     def metabolize(self, hours_elapsed: float) -> None:
-        decay = 0.5 ** (hours_elapsed / self.half_life_hours)
-        self.concentration *= decay
-        if self.concentration < self.baseline:
-            self.concentration = self.baseline
+        self.concentration = max(self.baseline, self.concentration * math.exp(CORT_DECAY_1H * hours_elapsed))
             
     def stress_accumulation(self, duration_hours: float, mission: MissionType) -> None:
-        mission_factors = {
-            MissionType.RECON: 1.15,
-            MissionType.DIRECT_ACTION: 1.65,
-            MissionType.AMBUSH: 1.9,
-            MissionType.WITHDRAWAL: 1.55,
-            MissionType.HOLDING: 1.35
-        }
-        
-        factor = mission_factors.get(mission, 1.2)
-        self.concentration += duration_hours * factor * 1.8
+        self.concentration += duration_hours * MISSION_FACTOR[mission] * 1.8
         self.deployment_days += duration_hours / 24
         
         if self.deployment_days > 7:
@@ -160,25 +415,96 @@ class Cortisol:
             self.concentration *= 1.25
             self.recovery_deficit += 0.4
         else:
-            if 5 <= hour <= 9:
-                self.concentration *= 1.35
-            elif 23 <= hour or hour <= 4:
-                self.concentration *= 1.15 if self.chronic_adaptation else 0.75
+            table = CIRC_MULT_CHRONIC if self.chronic_adaptation else CIRC_MULT
+            self.concentration *= table[min(max(hour, 0), 23)]
 
 class OperatorPhysiology:
-    def __init__(self, identifier: str, element: str):
+    __slots__ = (
+        "_buffer", "idx", "identifier", "element", "adrenaline", "cortisol", "event_log",
+        "threat_encounters", "communication_channels"
+    )
+
+    def __init__(self, identifier: str, element: str, buffer: Optional[PhysiologyBuffer] = None, idx: Optional[int] = None):
+        if buffer is None:
+            buffer = PhysiologyBuffer(1)
+        self._buffer = buffer
+        self.idx = buffer.allocate() if idx is None else idx
         self.identifier = identifier
         self.element = element
-        self.adrenaline = Adrenaline()
-        self.cortisol = Cortisol()
+        self.adrenaline = Adrenaline(buffer=buffer, idx=self.idx)
+        self.cortisol = Cortisol(buffer=buffer, idx=self.idx)
         self.posture = AlertLevel.STANDARD
-        self.current_mission: Optional[MissionType] = None
+        self.current_mission = None
         self.state = SoldierStatus.NORMAL
-        self.event_log: List[Dict] = []
-        self.threat_encounters: List[ThreatType] = []
-        self.communication_channels = []
+        self.event_log: Deque[Dict] = deque(maxlen=EVENT_LOG_CAPACITY)
+        self.threat_encounters: Deque[ThreatType] = deque(maxlen=EVENT_LOG_CAPACITY)
+        self.total_threat_encounters = 0
+        self.communication_channels: List[str] = []
         self.element_casualties = 0
         self.ammunition_expended = 0
+
+    @property
+    def sim_time(self) -> float:
+        return self._buffer.sim_time
+
+    @sim_time.setter
+    def sim_time(self, value: float) -> None:
+        self._buffer.sim_time = value
+
+    def _detach(self) -> None:
+        buffer = self._buffer.extract(self.idx)
+        for handle in (self, self.adrenaline, self.cortisol):
+            handle._buffer = buffer
+            handle.idx = 0
+
+    @property
+    def posture(self) -> AlertLevel:
+        return _ALERT_BY_ID[self._buffer.posture_id[self.idx]]
+
+    @posture.setter
+    def posture(self, value: AlertLevel) -> None:
+        self._buffer.posture_id[self.idx] = value
+
+    @property
+    def current_mission(self) -> Optional[MissionType]:
+        mission_id = self._buffer.mission_id[self.idx]
+        return None if mission_id == _NO_MISSION else _MISSION_BY_ID[mission_id]
+
+    @current_mission.setter
+    def current_mission(self, value: Optional[MissionType]) -> None:
+        self._buffer.mission_id[self.idx] = _NO_MISSION if value is None else value
+
+    @property
+    def state(self) -> SoldierStatus:
+        return _STATUS_BY_ID[self._buffer.state_id[self.idx]]
+
+    @state.setter
+    def state(self, value: SoldierStatus) -> None:
+        self._buffer.state_id[self.idx] = value
+
+    @property
+    def total_threat_encounters(self) -> int:
+        return int(self._buffer.encounters[self.idx])
+
+    @total_threat_encounters.setter
+    def total_threat_encounters(self, value: int) -> None:
+        self._buffer.encounters[self.idx] = value
+
+    @property
+    def element_casualties(self) -> int:
+        return int(self._buffer.casualties[self.idx])
+
+    @element_casualties.setter
+    def element_casualties(self, value: int) -> None:
+        self._buffer.casualties[self.idx] = value
+
+    @property
+    def ammunition_expended(self) -> int:
+        return int(self._buffer.rounds[self.idx])
+
+    @ammunition_expended.setter
+    def ammunition_expended(self, value: int) -> None:
+        self._buffer.rounds[self.idx] = value
         
     def operational_briefing(self, mission: MissionType, duration: float) -> Dict:
         self.current_mission = mission
@@ -189,42 +515,49 @@ class OperatorPhysiology:
         return {
             "operator": self.identifier,
             "element": self.element,
-            "mission_type": mission.value,
+            "mission_type": _MISSION_VALUES[mission],
             "projected_duration": duration,
-            "adrenaline_baseline": round(self.adrenaline.concentration, 1),
-            "cortisol_baseline": round(self.cortisol.concentration, 1),
-            "readiness_state": self.posture.value
+            "adrenaline_baseline": self.adrenaline.concentration,
+            "cortisol_baseline": self.cortisol.concentration,
+            "readiness_state": _ALERT_VALUES[self.posture]
         }
     
     def threat_engagement(self, threat: ThreatType, severity: float) -> Dict:
         self.posture = AlertLevel.COMBAT
-        self.threat_encounters.append(threat)
-        self.ammunition_expended += random.randint(45, 450)
+        self.total_threat_encounters += 1
+        self.ammunition_expended += int(_rng.integers(45, 451))
         
         response = self.adrenaline.acute_stress_response(threat)
         
-        self.cortisol.stress_accumulation(0.5, self.current_mission or MissionType.DIRECT_ACTION)
+        mission = self.current_mission
+        if mission is None:
+            mission = _DEFAULT_MISSION
+        self.cortisol.stress_accumulation(ENGAGEMENT_HOURS, mission)
         
-        if threat == ThreatType.AMBUSH:
-            self.state = SoldierStatus.PANICKED if random.random() < 0.25 else SoldierStatus.FOCUSED
-        elif threat == ThreatType.SNIPER:
-            self.state = SoldierStatus.FOCUSED
-        elif threat == ThreatType.IED:
-            self.state = SoldierStatus.TUNNEL_VISION
+        next_state = THREAT_TO_STATE[threat]
+        if threat == ThreatType.AMBUSH and _rng.random() < 0.25:
+            next_state = SoldierStatus.PANICKED
+        if next_state != _RETAIN_STATE:
+            self.state = _STATUS_BY_ID[next_state]
             
+        return self._log_engagement(threat, severity, response)
+
+    def _log_engagement(self, threat: ThreatType, severity: float, response: AcuteResponse) -> Dict:
         engagement_record = {
-            "timestamp": time.time(),
-            "threat_classification": threat.value,
+            "timestamp": self._buffer.sim_time,
+            "threat_classification": _THREAT_VALUES[threat],
             "severity_index": severity,
-            "adrenaline_response": response["concentration"],
-            "cortisol_concentration": round(self.cortisol.concentration, 1),
+            "adrenaline_response": response.concentration,
+            "cortisol_concentration": self.cortisol.concentration,
             "physiological_response": response,
-            "operator_state": self.state.value,
+            "operator_state": _STATUS_VALUES[self.state],
             "rounds_expended": self.ammunition_expended,
-            "awareness_index": response["metrics"].situational_awareness
+            "awareness_index": response.metrics.situational_awareness
         }
         
-        self.event_log.append(engagement_record)
+        if self._buffer.log_enabled:
+            self.threat_encounters.append(threat)
+            self.event_log.append(engagement_record)
         return engagement_record
     
     def element_casualty(self, severity: float) -> Dict:
@@ -237,9 +570,31 @@ class OperatorPhysiology:
         else:
             self.state = SoldierStatus.FOCUSED
             
+        heart_rate = 135 + int(_rng.integers(5, 26))
+        respiratory_rate = 28 + int(_rng.integers(3, 13))
+        return self._casualty_report(
+            self.element_casualties,
+            self.adrenaline.concentration,
+            self.cortisol.concentration,
+            self.state,
+            self.adrenaline.performance_modifier(),
+            heart_rate,
+            respiratory_rate
+        )
+
+    def _casualty_report(
+        self,
+        casualties: int,
+        adrenaline: float,
+        cortisol: float,
+        state: SoldierStatus,
+        effectiveness: float,
+        heart_rate: int,
+        respiratory_rate: int
+    ) -> Dict:
         vitals = PhysiologicalMetrics(
-            heart_rate_bpm=135 + random.randint(5, 25),
-            respiratory_rate=28 + random.randint(3, 12),
+            heart_rate_bpm=heart_rate,
+            respiratory_rate=respiratory_rate,
             pupil_dilation=0.75,
             tremor_intensity=0.28,
             auditory_threshold=0.65,
@@ -250,13 +605,13 @@ class OperatorPhysiology:
         
         return {
             "event": "element_casualty",
-            "cumulative_casualties": self.element_casualties,
-            "adrenaline_spike": round(self.adrenaline.concentration, 1),
-            "cortisol_level": round(self.cortisol.concentration, 1),
-            "psychological_state": self.state.value,
-            "combat_effectiveness": self.adrenaline.performance_modifier(),
+            "cumulative_casualties": casualties,
+            "adrenaline_spike": adrenaline,
+            "cortisol_level": cortisol,
+            "psychological_state": _STATUS_VALUES[state],
+            "combat_effectiveness": effectiveness,
             "physiological_state": vitals,
-            "immediate_response": "suppressive_fire" if self.state != SoldierStatus.PANICKED else "cover"
+            "immediate_response": "suppressive_fire" if state != SoldierStatus.PANICKED else "cover"
         }
     
     def tactical_retrograde(self, pursued: bool) -> Dict:
@@ -272,8 +627,8 @@ class OperatorPhysiology:
         assessment = {
             "maneuver": "tactical_retrograde",
             "pursuit_ongoing": pursued,
-            "adrenaline_state": round(self.adrenaline.concentration, 1),
-            "cortisol_state": round(self.cortisol.concentration, 1),
+            "adrenaline_state": self.adrenaline.concentration,
+            "cortisol_state": self.cortisol.concentration,
             "movement_efficiency": 1.0 + self.adrenaline.concentration * 0.12,
             "accuracy_degradation": self.adrenaline.concentration * 0.08 if pursued else 0.03,
             "cover_utilization": self.cortisol.concentration > 18,
@@ -291,17 +646,18 @@ class OperatorPhysiology:
         self.adrenaline.metabolize(recovery_period * 3600)
         self.cortisol.metabolize(recovery_period)
         
-        cognitive_state = self.cortisol.cognitive_assessment()
-        
+        return self._debrief_report(recovery_period, self.cortisol.cognitive_assessment())
+
+    def _debrief_report(self, recovery_period: float, cognitive_state: Dict) -> Dict:
         if self.cortisol.chronic_adaptation:
             report = {
                 "operator": self.identifier,
-                "deployment_duration_days": round(self.cortisol.deployment_days, 1),
-                "threat_encounters": len(self.threat_encounters),
+                "deployment_duration_days": self.cortisol.deployment_days,
+                "threat_encounters": self.total_threat_encounters,
                 "element_losses": self.element_casualties,
                 "chronic_stress_indicators": True,
-                "cognitive_decline": round(cognitive_state["working_memory"], 2),
-                "immune_status": round(cognitive_state["immune_competence"], 2),
+                "cognitive_decline": cognitive_state["working_memory"],
+                "immune_status": cognitive_state["immune_competence"],
                 "rotation_required": self.cortisol.deployment_days > 40,
                 "psychological_evaluation_recommended": self.cortisol.deployment_days > 55
             }
@@ -309,8 +665,8 @@ class OperatorPhysiology:
             report = {
                 "operator": self.identifier,
                 "mission_completion": True,
-                "final_adrenaline": round(self.adrenaline.concentration, 1),
-                "final_cortisol": round(self.cortisol.concentration, 1),
+                "final_adrenaline": self.adrenaline.concentration,
+                "final_cortisol": self.cortisol.concentration,
                 "recovery_allocated": recovery_period,
                 "operational_readiness": self.cortisol.concentration < 14
             }
@@ -327,8 +683,8 @@ class OperatorPhysiology:
             
         return {
             "unit_composition": team_roster,
-            "mean_cortisol": round(mean_cortisol, 1),
-            "cohesion_index": max(0.35, round(cohesion_index, 2)),
+            "mean_cortisol": mean_cortisol,
+            "cohesion_index": max(0.35, cohesion_index),
             "communication_efficacy": comms_effectiveness,
             "blue_on_blue_risk": "elevated" if mean_cortisol > 28 else "baseline",
             "mutual_support_index": max(0.45, 1.0 - (self.cortisol.deployment_days * 0.008))
@@ -337,24 +693,53 @@ class OperatorPhysiology:
 class BattalionTaskForce:
     def __init__(self, task_force_designation: str):
         self.task_force_designation = task_force_designation
-        self.personnel: Dict[str, OperatorPhysiology] = {}
+        self._personnel: Dict[str, OperatorPhysiology] = {}
+        self._roster: List[OperatorPhysiology] = []
+        self._physiology = PhysiologyBuffer()
         self.current_operational_tempo = AlertLevel.STANDARD
         self.area_classification = "contested"
         self.cumulative_deployment_days = 0
+
+    @property
+    def personnel(self) -> Mapping[str, OperatorPhysiology]:
+        return MappingProxyType(self._personnel)
+
+    @property
+    def sim_time(self) -> float:
+        return self._physiology.sim_time
+
+    @sim_time.setter
+    def sim_time(self, value: float) -> None:
+        self._physiology.sim_time = value
         
     def attach_operator(self, identifier: str, element: str) -> None:
-        self.personnel[identifier] = OperatorPhysiology(identifier, element)
+        previous = self._personnel.get(identifier)
+        if previous is None:
+            operator = OperatorPhysiology(identifier, element, self._physiology)
+            self._roster.append(operator)
+        else:
+            idx = previous.idx
+            previous._detach()
+            operator = OperatorPhysiology(identifier, element, self._physiology, idx)
+            self._roster[idx] = operator
+        self._personnel[identifier] = operator
         
     def element_contact(self, grid_reference: str, threat_intensity: float) -> Dict:
         self.current_operational_tempo = AlertLevel.COMBAT
         
+        buf = self._physiology
+        rounds = _rng.integers(45, 451, size=buf.size)
+        metrics = self._broadcast_engagement(ThreatType.AMBUSH, threat_intensity, self._engagement_loads(), rounds)
+        
+        states = buf.state_id[:buf.size].tolist()
+        adrenaline = buf.adr[:buf.size].tolist()
+        awareness = metrics["situational_awareness"].tolist()
         element_responses = {}
-        for identifier, operator in self.personnel.items():
-            response = operator.threat_engagement(ThreatType.AMBUSH, threat_intensity)
-            element_responses[identifier] = {
-                "state": response["operator_state"],
-                "adrenaline": response["adrenaline_response"],
-                "awareness": response["awareness_index"]
+        for operator, state, adr, aware in zip(self._roster, states, adrenaline, awareness):
+            element_responses[operator.identifier] = {
+                "state": _STATUS_VALUES[state],
+                "adrenaline": adr,
+                "awareness": aware
             }
             
         unit_status = self.assess_unit_readiness()
@@ -364,68 +749,192 @@ class BattalionTaskForce:
             "threat_magnitude": threat_intensity,
             "element_responses": element_responses,
             "unit_cohesion_index": unit_status["cohesion_index"],
-            "personnel_casualties": sum(1 for op in self.personnel.values() if op.element_casualties > 0),
+            "personnel_casualties": int(np.count_nonzero(buf.casualties[:buf.size])),
             "combat_effective_personnel": unit_status["effective_personnel"]
         }
     
+    def mass_casualty(self, identifiers: List[str], severities: List[float]) -> List[Dict]:
+        if len(severities) != len(identifiers):
+            raise ValueError("severities must match identifiers one-to-one")
+        
+        buf = self._physiology
+        operators = []
+        occurrences = []
+        seen: Dict[str, int] = {}
+        for identifier in identifiers:
+            operators.append(self._personnel[identifier])
+            seen[identifier] = seen.get(identifier, 0) + 1
+            occurrences.append(seen[identifier])
+        idx = np.array([operator.idx for operator in operators], dtype=np.intp)
+        occurrence = np.array(occurrences, dtype=np.int64)
+        
+        casualties = buf.casualties[idx] + occurrence
+        adrenaline = buf.adr[idx] * 2.3 ** occurrence
+        cortisol = buf.cort[idx] * 1.7 ** occurrence
+        states = np.where(casualties > 2, SoldierStatus.PANICKED, SoldierStatus.FOCUSED)
+        
+        np.add.at(buf.casualties, idx, 1)
+        np.multiply.at(buf.adr, idx, 2.3)
+        np.multiply.at(buf.cort, idx, 1.7)
+        buf.state_id[idx] = np.where(buf.casualties[idx] > 2, SoldierStatus.PANICKED, SoldierStatus.FOCUSED)
+        
+        effectiveness = performance_modifier_batch(buf.peak_resp[idx], buf.peak_ts[idx], buf.sim_time, adrenaline).tolist()
+        heart_rate = (135 + _rng.integers(5, 26, size=len(idx))).tolist()
+        respiratory_rate = (28 + _rng.integers(3, 13, size=len(idx))).tolist()
+        
+        return [
+            operator._casualty_report(count, adr, cort, _STATUS_BY_ID[state], effect, heart, respiration)
+            for operator, count, adr, cort, state, effect, heart, respiration in zip(
+                operators,
+                casualties.tolist(),
+                adrenaline.tolist(),
+                cortisol.tolist(),
+                states.tolist(),
+                effectiveness,
+                heart_rate,
+                respiratory_rate
+            )
+        ]
+    
     def assess_unit_readiness(self) -> Dict:
-        total_adrenaline = sum(op.adrenaline.concentration for op in self.personnel.values())
-        total_cortisol = sum(op.cortisol.concentration for op in self.personnel.values())
-        mean_adrenaline = total_adrenaline / len(self.personnel) if self.personnel else 0
-        mean_cortisol = total_cortisol / len(self.personnel) if self.personnel else 0
-        
-        effective_personnel = 0
-        for op in self.personnel.values():
-            if op.state != SoldierStatus.PANICKED and op.adrenaline.performance_modifier() > 0.58:
-                effective_personnel += 1
+        buf = self._physiology
+        adr = buf.adr[:buf.size]
+        cort = buf.cort[:buf.size]
+        mean_adrenaline = float(adr.mean()) if buf.size else 0
+        mean_cortisol = float(cort.mean()) if buf.size else 0
+        
+        performance = performance_modifier_batch(buf.peak_resp[:buf.size], buf.peak_ts[:buf.size], buf.sim_time, adr)
+        effective_personnel = int(np.count_nonzero((buf.state_id[:buf.size] != SoldierStatus.PANICKED) & (performance > 0.58)))
                 
         cohesion_index = 1.0 - (mean_cortisol - 10) * 0.018 if mean_cortisol > 10 else 1.0
         
         return {
             "task_force": self.task_force_designation,
-            "assigned_personnel": len(self.personnel),
-            "mean_adrenaline": round(mean_adrenaline, 1),
-            "mean_cortisol": round(mean_cortisol, 1),
+            "assigned_personnel": buf.size,
+            "mean_adrenaline": mean_adrenaline,
+            "mean_cortisol": mean_cortisol,
             "effective_personnel": effective_personnel,
-            "cohesion_index": max(0.25, round(cohesion_index, 2)),
-            "operational_tempo": self.current_operational_tempo.value,
-            "deployment_duration": round(self.cumulative_deployment_days, 1),
+            "cohesion_index": max(0.25, cohesion_index),
+            "operational_tempo": _ALERT_VALUES[self.current_operational_tempo],
+            "deployment_duration": self.cumulative_deployment_days,
             "relief_priority": "urgent" if mean_cortisol > 24 else "routine"
         }
     
     def night_operations_cycle(self, hour: int) -> None:
-        for operator in self.personnel.values():
-            watch_duty = random.random() < 0.3
-            operator.cortisol.circadian_modulation(hour, watch_duty)
+        buf = self._physiology
+        n = buf.size
+        hour = min(max(hour, 0), 23)
+        watch_duty = _rng.random(n) < 0.3
+        buf.cort[:n] *= np.where(
+            watch_duty,
+            1.25,
+            np.where(buf.chronic[:n], CIRC_MULT_CHRONIC[hour], CIRC_MULT[hour])
+        )
+        buf.recovery_deficit[:n] += watch_duty * 0.4
+            
+    @contextmanager
+    def bulk_mode(self) -> Iterator["BattalionTaskForce"]:
+        previous = self._physiology.log_enabled
+        self._physiology.log_enabled = False
+        try:
+            yield self
+        finally:
+            self._physiology.log_enabled = previous
             
     def extended_deployment_simulation(self, days: int) -> List[Dict]:
+        buf = self._physiology
+        cort = buf.cort[:buf.size]
+        cort_baseline = buf.cort_baseline[:buf.size]
+        
+        cort_load = self._engagement_loads()
+        
+        days = max(days, 0)
+        hits = (_rng.random((days, 14)) < 0.15).tolist()
+        threat_idx = _rng.integers(0, len(THREAT_LIST), size=(days, 14)).tolist()
+        severity = _rng.uniform(0.25, 0.95, size=(days, 14)).tolist()
+        
+        threats = THREAT_LIST
+        draw_rounds = _rng.integers
+        maximum = np.maximum
+        broadcast = self._broadcast_engagement
+        assess = self.assess_unit_readiness
         daily_assessments = []
-        for day in range(days):
-            self.cumulative_deployment_days += 1
-            
-            for hour in range(24):
-                if hour % 4 == 0:
-                    for operator in self.personnel.values():
-                        operator.cortisol.metabolize(4)
-                        
-                if 6 <= hour <= 19 and random.random() < 0.15:
-                    threat = random.choice(list(ThreatType))
-                    severity = random.uniform(0.25, 0.95)
-                    for operator in self.personnel.values():
-                        operator.threat_engagement(threat, severity)
+        with self.bulk_mode():
+            for day in range(days):
+                self.cumulative_deployment_days += 1
+                day_hits = hits[day]
+                
+                for hour in range(24):
+                    if hour % 4 == 0:
+                        cort *= DECAY_4H
+                        maximum(cort, cort_baseline, out=cort)
+                            
+                    window = hour - 6
+                    if 6 <= hour <= 19 and day_hits[window]:
+                        rounds = draw_rounds(45, 451, size=buf.size)
+                        broadcast(threats[threat_idx[day][window]], severity[day][window], cort_load, rounds)
                         
-            daily_assessment = self.assess_unit_readiness()
-            daily_assessments.append(daily_assessment)
+                    buf.sim_time += 3600
+                            
+                daily_assessments.append(assess())
             
         return daily_assessments
     
+    def _engagement_loads(self) -> np.ndarray:
+        mission_id = self._physiology.mission_id[:self._physiology.size]
+        return ENGAGEMENT_CORT_LOAD[np.where(mission_id == _NO_MISSION, _DEFAULT_MISSION, mission_id)]
+    
+    def _broadcast_engagement(self, threat: ThreatType, severity: float, cort_load: np.ndarray, rounds: np.ndarray) -> np.ndarray:
+        buf = self._physiology
+        n = buf.size
+        
+        buf.adr[:n] *= THREAT_MULT[threat]
+        buf.peak_resp[:n] = True
+        buf.peak_ts[:n] = buf.sim_time
+        buf.rounds[:n] += rounds
+        
+        buf.cort[:n] += cort_load
+        deploy_days = buf.deploy_days[:n]
+        deploy_days += ENGAGEMENT_HOURS / 24
+        chronic = deploy_days > 7
+        buf.cort_baseline[:n][chronic] *= 1.15
+        buf.chronic[:n] |= chronic
+        
+        next_state = THREAT_TO_STATE[threat]
+        if threat == ThreatType.AMBUSH:
+            buf.state_id[:n] = np.where(_rng.random(n) < 0.25, SoldierStatus.PANICKED, next_state)
+        elif next_state != _RETAIN_STATE:
+            buf.state_id[:n] = next_state
+            
+        buf.encounters[:n] += 1
+        buf.posture_id[:n] = AlertLevel.COMBAT
+            
+        metrics = compute_metrics_batch(buf.adr[:n])
+        if buf.log_enabled:
+            for operator, row in zip(self._roster, metrics.tolist()):
+                vitals = PhysiologicalMetrics(*row)
+                operator._log_engagement(threat, severity, operator.adrenaline._stress_profile(vitals))
+        return metrics
+    
     def unit_extraction(self, extraction_zone: str) -> Dict:
-        recovery_allocation = 72
-        final_status = {}
+        buf = self._physiology
+        n = buf.size
+        adr = buf.adr[:n]
+        cort = buf.cort[:n]
+        cort_baseline = buf.cort_baseline[:n]
+        
+        adr *= ADR_DECAY_RECOVERY
+        buf.peak_resp[:n] &= adr >= buf.adr_trigger[:n]
+        np.maximum(cort_baseline, cort * CORT_DECAY_RECOVERY, out=cort)
+        cognitive_rows = cognitive_metrics_batch(cort - cort_baseline).tolist()
         
-        for identifier, operator in self.personnel.items():
-            debrief = operator.extraction_debrief(recovery_allocation)
-            final_status[identifier] = debrief
+        buf.posture_id[:n] = AlertLevel.STANDARD
+        buf.mission_id[:n] = _NO_MISSION
+        
+        final_status = {}
+        for operator, cognitive_row in zip(self._roster, cognitive_rows):
+            cognitive_state = dict(zip(_COG_KEYS, cognitive_row))
+            final_status[operator.identifier] = operator._debrief_report(RECOVERY_PERIOD_HOURS, cognitive_state)
             
         unit_assessment = self.assess_unit_readiness()
         
@@ -437,7 +946,16 @@ class BattalionTaskForce:
             "mission_termination": True
         }
 
-if __name__ == "__main__":
+def _fmt(report: object) -> object:
+    if isinstance(report, dict):
+        return {key: _fmt(value) for key, value in report.items()}
+    if isinstance(report, float):
+        return round(report, 2)
+    return report
+
+def _demo() -> None:
+    seed(0)
+    
     battletask_force_raider = BattalionTaskForce("TF Raider")
     
     battletask_force_raider.attach_operator("Maverick", "Alpha")
@@ -446,7 +964,7 @@ if __name__ == "__main__":
     battletask_force_raider.attach_operator("Havoc", "Bravo")
     
     print("=== MISSION BRIEF: OPERATION URBAN RESOLVE ===")
-    print(battletask_force_raider.personnel["Maverick"].operational_briefing(MissionType.DIRECT_ACTION, 24))
+    print(_fmt(battletask_force_raider.personnel["Maverick"].operational_briefing(MissionType.DIRECT_ACTION, 24)))
     
     print("\n=== CONTACT REPORT: ELEMENT AMBUSHED ===")
     contact = battletask_force_raider.element_contact("Sector 7-4", 0.9)
@@ -454,15 +972,15 @@ if __name__ == "__main__":
     print(f"Combat Effective Personnel: {contact['combat_effective_personnel']}")
     
     print("\n=== CASUALTY REPORT: ELEMENT LOSS ===")
-    print(battletask_force_raider.personnel["Ghost"].element_casualty(0.7))
+    print(_fmt(battletask_force_raider.personnel["Ghost"].element_casualty(0.7)))
     
     print("\n=== TACTICAL MOVEMENT: RETROGRADE ===")
-    print(battletask_force_raider.personnel["Reaper"].tactical_retrograde(True))
+    print(_fmt(battletask_force_raider.personnel["Reaper"].tactical_retrograde(True)))
     
     print("\n=== 30-DAY DEPLOYMENT ANALYSIS ===")
     deployment = battletask_force_raider.extended_deployment_simulation(30)
-    print(f"Final Day Cohesion Index: {deployment[-1]['cohesion_index']}")
-    print(f"Final Day Mean Cortisol: {deployment[-1]['mean_cortisol']}")
+    print(f"Final Day Cohesion Index: {deployment[-1]['cohesion_index']:.2f}")
+    print(f"Final Day Mean Cortisol: {deployment[-1]['mean_cortisol']:.1f}")
     
     print("\n=== UNIT READINESS ASSESSMENT ===")
     status = battletask_force_raider.assess_unit_readiness()
@@ -470,9 +988,12 @@ if __name__ == "__main__":
     print(f"Relief Priority: {status['relief_priority']}")
     
     print("\n=== COHESION ANALYSIS: ALPHA-BRAVO INTEGRATION ===")
-    print(battletask_force_raider.personnel["Maverick"].unit_cohesion_analysis(["Ghost", "Reaper", "Havoc"]))
+    print(_fmt(battletask_force_raider.personnel["Maverick"].unit_cohesion_analysis(["Ghost", "Reaper", "Havoc"])))
     
     print("\n=== EXTRACTION & DEBRIEFING SUMMARY ===")
     extraction = battletask_force_raider.unit_extraction("LZ Phoenix")
     print(f"Command Recommendation: {extraction['command_recommendation']}")
-    print(f"Total Deployment Days: {extraction['unit_readiness']['deployment_duration']}")
+    print(f"Total Deployment Days: {extraction['unit_readiness']['deployment_duration']:.1f}")
+
+if __name__ == "__main__":
+    _demo()